@@ -1,4 +1,6 @@
 import abc
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Literal, Type
 
 from pydantic import BaseModel, Field
@@ -13,7 +15,8 @@ class LookerConfig(BaseModel):
     client_secret: str
 
 
-class Explore(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Explore:
     model_name: str
     explore_name: str
 
@@ -73,6 +76,9 @@ class TestResult(BaseModel, abc.ABC):
         return {**base, "grade": self.grade}
 
     class Config:
+        # Stop pydantic from treating the cached grade as a field
+        keep_untouched = (cached_property,)
+
         @staticmethod
         def schema_extra(schema: dict[str, Any], model: Type["TestResult"]) -> None:
             schema["properties"]["grade"] = {
@@ -88,7 +94,7 @@ class InactiveUserResult(TestResult):
     pct_inactive: float
     sample_user_names: list[str]
 
-    @property
+    @cached_property
     def grade(self) -> Grade:
         if self.pct_inactive > 0.3:
             return "bad"
@@ -103,7 +109,7 @@ class SlowExploresResult(TestResult):
     test_id: Literal["slow_explores"] = "slow_explores"
     slow_explores: list[ExplorePerformance]  # sorted by avg_runtime, descending
 
-    @property
+    @cached_property
     def grade(self) -> Grade:
         if self.slow_explores[0].avg_runtime > 40:
             return "bad"
@@ -119,7 +125,7 @@ class ExploreSizeResult(TestResult):
     large_explores: list[ExploreSize]  # sorted by field_count, descending
     median_explore_size: int
 
-    @property
+    @cached_property
     def grade(self) -> Grade:
         if self.large_explores[0].field_count >= 750:
             return "bad"
@@ -135,7 +141,7 @@ class UnusedExploreResult(TestResult):
     unused_explores: list[ExploreQueries]  # sorted by query_count, descending
     unused_percentage: float
 
-    @property
+    @cached_property
     def grade(self) -> Grade:
         count_unused = len(self.unused_explores)
         if count_unused > 5 or self.unused_percentage > 0.05:
@@ -151,7 +157,7 @@ class UnusedFieldsResult(TestResult):
     test_id: Literal["unused_fields"] = "unused_fields"
     pct_unused: float
 
-    @property
+    @cached_property
     def grade(self) -> Grade:
         return "bad"
 
@@ -161,7 +167,7 @@ class UnusedFieldsExploreResult(TestResult):
     test_id: Literal["explores_with_unused_fields"] = "explores_with_unused_fields"
     explores: list[ExploreUnusedFields]
 
-    @property
+    @cached_property
     def grade(self) -> Grade:
         return "bad"
 
@@ -173,7 +179,7 @@ class AbandonedDashboardResult(TestResult):
     count_abandoned: int
     sample_abandoned_dashboards: list[DashboardUsage]
 
-    @property
+    @cached_property
     def grade(self) -> Grade:
         if self.pct_abandoned > 0.1:
             return "bad"
@@ -188,7 +194,7 @@ class OverusedQueryResult(TestResult):
     test_id: Literal["overused_queries"] = "overused_queries"
     sample_overused_queries: list[QueryUsage]  # sorted by database_run_count desc
 
-    @property
+    @cached_property
     def grade(self) -> Grade:
         # 3360 = 24 * 7 * 20
         if self.sample_overused_queries[0].database_run_count > 3360:
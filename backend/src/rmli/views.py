@@ -1,14 +1,32 @@
 import asyncio
-import json
-from typing import Any
-import statistics
+import csv
+import io
+import logging
+import random
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Any, cast
 
-import backoff
 import looker_sdk
+import uvloop
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from looker_sdk.error import SDKError
 from looker_sdk.sdk.api40.methods import Looker40SDK as LookerSdkClient
 from looker_sdk.sdk.api40.models import User, WriteQuery
+from pydantic import parse_obj_as
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # fall back to stdlib if the wheel isn't available
+    from json import loads as json_loads
 
 from rmli.models import (
     ExplorePerformance,
@@ -25,36 +43,121 @@ from rmli.models import (
     QueryUsage,
 )
 
-app = FastAPI()
+logger = logging.getLogger(__name__)
 
+uvloop.install()
 
-class AppApiSettings(looker_sdk.api_settings.ApiSettings):
-    def __init__(self, *args, **kw_args) -> None:  # type: ignore
-        self.host_url = kw_args.pop("host_url")
-        self.port = kw_args.pop("port")
-        self.client_id = kw_args.pop("client_id")
-        self.client_secret = kw_args.pop("client_secret")
-        super().__init__(*args, **kw_args)
+app = FastAPI(default_response_class=ORJSONResponse)
 
-    def read_config(self) -> looker_sdk.api_settings.SettingsConfig:
-        config = super().read_config()
-        config["base_url"] = f"{self.host_url}:{self.port}"
-        config["client_id"] = self.client_id
-        config["client_secret"] = self.client_secret
-        return config
+# Bound the number of simultaneous Looker API calls when fanning out per explore
+EXPLORE_SEMAPHORE = asyncio.Semaphore(16)
 
 
-def get_looker_client(config: LookerConfig) -> LookerSdkClient:
-    """Set up the Looker API client using a LookerConfig."""
+@app.on_event("startup")
+async def set_up_thread_pool() -> None:
+    # Share one pool sized for our SDK fan-out across all asyncio.to_thread calls
+    app.state.thread_pool = ThreadPoolExecutor(max_workers=32)
+    asyncio.get_running_loop().set_default_executor(app.state.thread_pool)
+
+
+@app.on_event("shutdown")
+async def shut_down_thread_pool() -> None:
+    app.state.thread_pool.shutdown()
+
+
+# Looker metadata changes on the order of hours, so a short TTL is safe
+CACHE_TTL_SECONDS = 300.0
+
+
+async def sdk_call(fn: Any, *args: Any, tries: int = 3, **kwargs: Any) -> Any:
+    """Run a blocking SDK call in a thread, retrying SDKErrors with jitter."""
+    for attempt in range(tries):
+        try:
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        except SDKError:
+            if attempt == tries - 1:
+                raise
+            await asyncio.sleep(2**attempt + random.random())
+
+
+_result_cache: dict[tuple[str, str, str], tuple[float, Any]] = {}
+_result_cache_lock = asyncio.Lock()
+
+
+async def cached(key: tuple[str, str, str], fn: Any, *args: Any) -> Any:
+    """Return the cached result for `key`, recomputing it once the TTL expires."""
+    async with _result_cache_lock:
+        hit = _result_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < CACHE_TTL_SECONDS:
+            return hit[1]
+
+    value = await fn(*args)
+
+    async with _result_cache_lock:
+        _result_cache[key] = (time.monotonic(), value)
+
+    return value
+
+
+class AppApiSettings(looker_sdk.api_settings.ApiSettings):
+    def __init__(
+        self, host_url: str, port: int, client_id: str, client_secret: str
+    ) -> None:
+        self.host_url = host_url
+        self.port = port
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self._config_cache: looker_sdk.api_settings.SettingsConfig | None = None
+        super().__init__()
+
+    def read_config(self) -> looker_sdk.api_settings.SettingsConfig:
+        # The SDK re-reads config on every auth refresh; build it only once
+        if self._config_cache is None:
+            config = super().read_config()
+            config["base_url"] = f"{self.host_url}:{self.port}"
+            config["client_id"] = self.client_id
+            config["client_secret"] = self.client_secret
+            self._config_cache = config
+        return self._config_cache
+
+
+@lru_cache(maxsize=8)
+def _init_looker_client(
+    host_url: str, port: int, client_id: str, client_secret: str
+) -> LookerSdkClient:
     try:
-        client = looker_sdk.init40(config_settings=AppApiSettings(**dict(config)))
+        client = looker_sdk.init40(
+            config_settings=AppApiSettings(host_url, port, client_id, client_secret)
+        )
     except SDKError:
-        config.port = 443
-        client = looker_sdk.init40(config_settings=AppApiSettings(**dict(config)))
+        client = looker_sdk.init40(
+            config_settings=AppApiSettings(host_url, 443, client_id, client_secret)
+        )
+
+    # Size the keep-alive pool to match the thread pool so concurrent calls
+    # reuse warm connections instead of re-handshaking; retries stay with
+    # sdk_call rather than urllib3
+    client.transport.session.mount(  # type: ignore[attr-defined]
+        "https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+    )
+
+    # Pin compressed transfer for the large query payloads; requests sends
+    # this by default, but be explicit so it survives any header overrides.
+    # br is omitted because no brotli decoder is installed alongside urllib3
+    client.transport.session.headers[  # type: ignore[attr-defined]
+        "Accept-Encoding"
+    ] = "gzip, deflate"
 
     return client
 
 
+def get_looker_client(config: LookerConfig) -> LookerSdkClient:
+    """Get the Looker API client for a LookerConfig, reusing it across requests."""
+    return _init_looker_client(
+        config.host_url, config.port, config.client_id, config.client_secret
+    )
+
+
 @app.post("/stats/inactive_users", response_model=InactiveUserResult)
 async def inactive_users(config: LookerConfig) -> InactiveUserResult:
     client = get_looker_client(config)
@@ -70,7 +173,7 @@ async def inactive_users(config: LookerConfig) -> InactiveUserResult:
 async def slow_explores(config: LookerConfig) -> SlowExploresResult:
     client = get_looker_client(config)
     results = await get_longest_running_explores(client)
-    slow_explores = [ExplorePerformance.parse_obj(result) for result in results]
+    slow_explores = parse_obj_as(list[ExplorePerformance], results)
     top_3 = sorted(
         slow_explores, key=lambda explore: explore.avg_runtime, reverse=True
     )[:3]
@@ -80,14 +183,18 @@ async def slow_explores(config: LookerConfig) -> SlowExploresResult:
 @app.post("/stats/large_explores", response_model=ExploreSizeResult)
 async def large_explores(config: LookerConfig) -> ExploreSizeResult:
     client = get_looker_client(config)
-    results = await get_explore_field_count(client)
-    large_explores = [ExploreSize.parse_obj(result) for result in results]
-    top_3 = sorted(
+    results = await cached(
+        (config.host_url, config.client_id, "large_explores"),
+        get_explore_field_count,
+        client,
+    )
+    large_explores = parse_obj_as(list[ExploreSize], results)
+    by_field_count = sorted(
         large_explores, key=lambda explore: explore.field_count, reverse=True
-    )[:3]
-    median_explore_size = int(
-        statistics.median([explore.field_count for explore in large_explores])
     )
+    top_3 = by_field_count[:3]
+    # The list is already sorted, so the median is just the middle element
+    median_explore_size = by_field_count[len(by_field_count) // 2].field_count
     return ExploreSizeResult(
         large_explores=top_3, median_explore_size=median_explore_size
     )
@@ -96,8 +203,12 @@ async def large_explores(config: LookerConfig) -> ExploreSizeResult:
 @app.post("/stats/unused_explores", response_model=UnusedExploreResult)
 async def unused_explores(config: LookerConfig) -> UnusedExploreResult:
     client = get_looker_client(config)
-    results = await get_unused_explores(client)
-    explores = [ExploreQueries.parse_obj(result) for result in results]
+    results = await cached(
+        (config.host_url, config.client_id, "unused_explores"),
+        get_unused_explores,
+        client,
+    )
+    explores = parse_obj_as(list[ExploreQueries], results)
     count_explores = len(explores)
     unused_explores = [explore for explore in explores if explore.query_count == 0]
     count_unused_explores = len(unused_explores)
@@ -116,7 +227,7 @@ async def unused_explores(config: LookerConfig) -> UnusedExploreResult:
 async def abandoned_dashboards(config: LookerConfig) -> AbandonedDashboardResult:
     client = get_looker_client(config)
     results = await get_dashboard_usage(client)
-    dashboards = [DashboardUsage.parse_obj(result) for result in results]
+    dashboards = parse_obj_as(list[DashboardUsage], results)
     dashboard_count = len(dashboards)
     abandoned_dashboards = [
         dashboard for dashboard in dashboards if dashboard.query_count == 0
@@ -142,7 +253,7 @@ async def abandoned_dashboards(config: LookerConfig) -> AbandonedDashboardResult
 async def overused_queries(config: LookerConfig) -> OverusedQueryResult:
     client = get_looker_client(config)
     results = await get_query_usage(client)
-    queries = [QueryUsage.parse_obj(result) for result in results]
+    queries = parse_obj_as(list[QueryUsage], results)
     return OverusedQueryResult(sample_overused_queries=queries)
 
 
@@ -151,47 +262,106 @@ async def health_check() -> str:
     return "ok"
 
 
-@backoff.on_exception(backoff.expo, SDKError, max_tries=3)
+async def fetch_all_paginated(
+    fn: Any, page_size: int = 100, concurrency: int = 8, **kwargs: Any
+) -> list[Any]:
+    """Fetch every page of an offset-paginated SDK endpoint concurrently.
+
+    Issues `concurrency` pages at a time instead of waiting for each page
+    before requesting the next, and stops once a short page comes back.
+    """
+    results: list[Any] = []
+    offset = 0
+
+    while True:
+        pages = await asyncio.gather(
+            *(
+                sdk_call(fn, limit=page_size, offset=offset + i * page_size, **kwargs)
+                for i in range(concurrency)
+            )
+        )
+        for page in pages:
+            results.extend(page)
+        if any(len(page) < page_size for page in pages):
+            break
+        offset += page_size * concurrency
+
+    return results
+
+
+async def list_all_explores(client: LookerSdkClient) -> list[dict[str, Any]]:
+    """Get every (model, explore) pair defined in Looker, cached per instance."""
+    settings = cast(AppApiSettings, client.auth.settings)
+    explores: list[dict[str, Any]] = await cached(
+        (settings.host_url, settings.client_id, "explores"), fetch_all_explores, client
+    )
+    return explores
+
+
+async def fetch_all_explores(client: LookerSdkClient) -> list[dict[str, Any]]:
+    # explores(name,hidden) trims each explore to the two keys we read
+    models = await fetch_all_paginated(
+        client.all_lookml_models, page_size=500, fields="name,explores(name,hidden)"
+    )
+
+    # Deduplicate so no explore triggers more than one field fetch downstream,
+    # and skip hidden explores everywhere
+    explores: set[tuple[str, str]] = set()
+    for model in models:
+        if model.explores:
+            for explore in model.explores:
+                if model.name and explore.name and not explore.hidden:
+                    explores.add((model.name, explore.name))
+
+    return [
+        {"model": model_name, "explore": explore_name}
+        for model_name, explore_name in sorted(explores)
+    ]
+
+
 async def get_dashboard_usage(
     client: LookerSdkClient,
 ) -> list[dict[str, Any]]:
     """Get all dashboards and their query volume in the last 90 days"""
-    all_dashboards = client.all_dashboards(fields="id,title")
+    all_dashboards = await sdk_call(client.all_dashboards, fields="id,title")
 
     query = WriteQuery(
         model="system__activity",
         view="history",
         fields=["history.real_dash_id", "history.query_run_count"],
         filters={"history.created_date": "last 90 days"},
+        limit="5000",
     )
     try:
-        results_raw = client.run_inline_query(result_format="json", body=query)
+        results_raw = await sdk_call(
+            client.run_inline_query, result_format="csv", body=query
+        )
     except SDKError as e:
         # TODO: Replace with our own error handling
         raise e
-    else:
-        results = json.loads(results_raw)
 
-    output = []
+    # Stream the rows into per-dashboard counts without materializing them all
+    counts: defaultdict[str, int] = defaultdict(int)
+    reader = csv.reader(io.StringIO(results_raw))
+    next(reader, None)  # skip the header row
+    for row in reader:
+        if len(row) >= 2 and row[1]:
+            counts[row[0]] += int(row[1])
 
+    output = []
     for dashboard in all_dashboards:
-        query_count = 0
-        for result in results:
-            if result["history.real_dash_id"] == dashboard.id:
-                query_count += result["history.query_run_count"]
         if dashboard.id and dashboard.title:
             output.append(
                 {
                     "dashboard_id": dashboard.id,
                     "dashboard_title": dashboard.title,
-                    "query_count": query_count,
+                    "query_count": counts.get(dashboard.id, 0),
                 }
             )
 
     return output
 
 
-@backoff.on_exception(backoff.expo, SDKError, max_tries=3)
 async def get_longest_running_explores(client: LookerSdkClient) -> Any:
     """Get the 10 Explores with the longest average runtime in Looker"""
     query = WriteQuery(
@@ -211,107 +381,82 @@ async def get_longest_running_explores(client: LookerSdkClient) -> Any:
         sorts=["history.average_runtime desc"],
     )
     try:
-        results_raw = client.run_inline_query(result_format="json", body=query)
+        results_raw = await sdk_call(
+            client.run_inline_query, result_format="json", body=query
+        )
     except SDKError as e:
         # TODO: Replace with our own error handling
         raise e
     else:
-        results = json.loads(results_raw)
+        results = json_loads(results_raw)
 
     return results
 
 
-@backoff.on_exception(backoff.expo, SDKError, max_tries=3)
 async def get_inactive_user_percentage(
     client: LookerSdkClient,
 ) -> tuple[float, list[str]]:
     """Get the percentage of inactive users in Looker"""
+    # Selecting only the user_id dimension makes Looker group server-side,
+    # so this returns one row per distinct active user, not per query
     query = WriteQuery(
         model="system__activity",
         view="history",
         fields=["history.user_id"],
-        filters={"history.created_date": "last 30 days"},
+        filters={
+            "history.created_date": "last 30 days",
+            "history.user_id": "NOT NULL",
+        },
         limit="50000",
     )
     try:
-        results_raw = client.run_inline_query(result_format="json", body=query)
+        results_raw = await sdk_call(
+            client.run_inline_query, result_format="csv", body=query
+        )
     except SDKError as e:
         # TODO: Replace with our own error handling
         raise e
-    else:
-        active_users = json.loads(results_raw)
 
     # Get the IDs of all the users with queries in the last 30 days
-    active_users_list = [str(user["history.user_id"]) for user in active_users]
-
-    offset = 0
-    keep_going = True
-    all_users: list[User] = []
+    reader = csv.reader(io.StringIO(results_raw))
+    next(reader, None)  # skip the header row
+    active_user_ids = {row[0] for row in reader if row and row[0]}
 
     # Get all the users in Looker
-    while keep_going:
-        users = client.all_users(
-            fields="id,is_disabled,verified_looker_employee",
-            limit=100,
-            offset=offset,
-        )
+    all_users: list[User] = await fetch_all_paginated(
+        client.all_users,
+        page_size=500,
+        fields="id,is_disabled,verified_looker_employee,display_name",
+    )
 
-        if len(users) == 0:
-            keep_going = False
-        else:
-            all_users.extend(users)
-            offset += 100
-
-    # Filter out disabled users and Looker employees
-    all_users = [
-        user
-        for user in all_users
-        if not user.is_disabled and not user.verified_looker_employee
-    ]
+    # Filter out disabled users and Looker employees, collecting the inactive
+    # ones in the same pass
+    all_users_count = 0
+    inactive_users = []
+    for user in all_users:
+        if user.is_disabled or user.verified_looker_employee:
+            continue
+        all_users_count += 1
+        if user.id not in active_user_ids:
+            inactive_users.append(user)
+
+    if all_users_count == 0:
+        return 0.0, []
 
-    # Do some counting
-    all_users_count = len(all_users)
-    inactive_users = [user for user in all_users if user.id not in active_users_list]
     inactive_users_count = len(inactive_users)
     inactive_user_percentage = inactive_users_count / all_users_count
 
-    sample_count = 0
-    sample_user_names = []
-    i = 0
-
-    while sample_count < 3 and i + 1 <= inactive_users_count:
-        inactive_user_id = str(inactive_users[i].id)
-        display_name = client.user(inactive_user_id).display_name
-        if display_name:
-            sample_user_names.append(display_name)
-            sample_count += 1
-        i += 1
+    sample_user_names = list(
+        islice((user.display_name for user in inactive_users if user.display_name), 3)
+    )
 
     return inactive_user_percentage, sample_user_names
 
 
-@backoff.on_exception(backoff.expo, SDKError, max_tries=3)
 async def get_explore_field_count(client: LookerSdkClient) -> list[dict[str, Any]]:
     """Get the number of explores and fields in Looker"""
-    offset = 0
-    keep_going = True
-    explores = []
-
     # Get all the explores in Looker
-    while keep_going:
-        models_page = client.all_lookml_models(
-            fields="name,explores", limit=100, offset=offset
-        )
-        for model in models_page:
-            if model.explores:
-                for explore in model.explores:
-                    if model.name and explore.name:
-                        explores.append({"model": model.name, "explore": explore.name})
-
-        if len(models_page) < 100:
-            keep_going = False
-        else:
-            offset += 100
+    explores = await list_all_explores(client)
 
     # Get all the number of fields in each explore
     tasks = (
@@ -322,9 +467,10 @@ async def get_explore_field_count(client: LookerSdkClient) -> list[dict[str, Any
     return explore_fields
 
 
-@backoff.on_exception(backoff.expo, SDKError, max_tries=3)
 async def get_unused_explores(client: LookerSdkClient) -> list[dict[str, Any]]:
     """Get explore usage in the last 90 days"""
+    # query_run_count is a measure grouped by (model, view), so Looker returns
+    # one pre-summed row per explore; the limit only needs to cover explores
     query = WriteQuery(
         model="system__activity",
         view="history",
@@ -333,52 +479,37 @@ async def get_unused_explores(client: LookerSdkClient) -> list[dict[str, Any]]:
             "history.created_date": "last 90 days",
             "history.workspace_id": "production",
         },
-        limit="50000",
+        sorts=["history.query_run_count desc"],
+        limit="5000",
     )
     try:
-        results_raw = client.run_inline_query(result_format="json", body=query)
+        results_raw = await sdk_call(
+            client.run_inline_query, result_format="csv", body=query
+        )
     except SDKError as e:
         # TODO: Replace with our own error handling
         raise e
-    else:
-        results = json.loads(results_raw)
 
-    offset = 0
-    keep_going = True
-    explores: list[dict[str, Any]] = []
+    # Stream the rows into per-explore counts without materializing them all
+    counts: defaultdict[tuple[str, str], int] = defaultdict(int)
+    reader = csv.reader(io.StringIO(results_raw))
+    next(reader, None)  # skip the header row
+    for row in reader:
+        if len(row) >= 3 and row[2]:
+            counts[(row[0], row[1])] += int(row[2])
 
-    # Get all the explores in Looker
-    while keep_going:
-        models_page = client.all_lookml_models(
-            fields="name,explores", limit=100, offset=offset
-        )
-        for model in models_page:
-            if model.explores:
-                for model_explore in model.explores:
-                    if model.name and model_explore.name and not model_explore.hidden:
-                        explores.append(
-                            {"model": model.name, "explore": model_explore.name}
-                        )
-
-        if len(models_page) < 100:
-            keep_going = False
-        else:
-            offset += 100
+    # Copy the shared catalog entries before annotating them with run counts
+    explores = [dict(explore) for explore in await list_all_explores(client)]
 
     # Get the run count for each explore
     for explore in explores:
-        explore["query_run_count"] = 0
-        for result in results:
-            if (
-                result["query.model"] == explore["model"]
-                and result["query.view"] == explore["explore"]
-            ):
-                explore["query_run_count"] += result["history.query_run_count"]
+        explore["query_run_count"] = counts.get(
+            (explore["model"], explore["explore"]), 0
+        )
 
     return explores
 
 
-@backoff.on_exception(backoff.expo, SDKError, max_tries=3)
 async def get_query_usage(client: LookerSdkClient) -> list[dict[str, Any]]:
     """Get queries most frequently run queries in last 7 days"""
     query = WriteQuery(
@@ -397,17 +528,18 @@ async def get_query_usage(client: LookerSdkClient) -> list[dict[str, Any]]:
         sorts=["history.database_result_query_count desc"],
     )
     try:
-        results_raw = client.run_inline_query(result_format="json", body=query)
+        results_raw = await sdk_call(
+            client.run_inline_query, result_format="json", body=query
+        )
     except SDKError as e:
         # TODO: Replace with our own error handling
         raise e
     else:
-        results = json.loads(results_raw)
+        results = json_loads(results_raw)
 
     return results
 
 
-@backoff.on_exception(backoff.expo, SDKError, max_tries=3)
 async def get_unused_fields(client: LookerSdkClient) -> list[dict[str, Any]]:
     """Get field usage in the last 90 days"""
     query = WriteQuery(
@@ -423,87 +555,127 @@ async def get_unused_fields(client: LookerSdkClient) -> list[dict[str, Any]]:
         limit="50000",
     )
     try:
-        results_raw = client.run_inline_query(result_format="json", body=query)
+        results_raw = await sdk_call(
+            client.run_inline_query, result_format="json", body=query
+        )
     except SDKError as e:
         # TODO: Replace with our own error handling
         raise e
     else:
-        results = json.loads(results_raw)
+        results = json_loads(results_raw)
 
-    offset = 0
-    keep_going = True
-    explores: list[dict[str, Any]] = []
+    # Get the run count for each field
+    usage: defaultdict[tuple[str, str, str], int] = defaultdict(int)
+    for result in results:
+        usage[
+            (
+                result["field_usage.model"],
+                result["field_usage.explore"],
+                result["field_usage.field"],
+            )
+        ] += result["field_usage.times_used"]
+
+    # The usage index replaces the raw rows; free them before the fan-out
+    del results, results_raw
 
     # Get all the explores in Looker
-    while keep_going:
-        models_page = client.all_lookml_models(
-            fields="name,explores", limit=100, offset=offset
-        )
-        for model in models_page:
-            if model.explores:
-                for explore in model.explores:
-                    explores.append({"model": model.name, "explore": explore.name})
-
-        if len(models_page) < 100:
-            keep_going = False
-        else:
-            offset += 100
-
-    # Get the fields for each explore
-    tasks = tuple(
+    explores = await list_all_explores(client)
+
+    # Get the fields for each explore, keeping only fields with less than 50
+    # runs in the last 90 days; each explore is folded into the output as soon
+    # as its fetch finishes rather than after the whole fan-out completes
+    tasks = [
         get_explore_fields(client, explore["model"], explore["explore"])
         for explore in explores
-    )
-    explore_fields = await asyncio.gather(*tasks)
+    ]
+    unused_fields = []
+    for task in asyncio.as_completed(tasks):
+        explore_fields = await task
+        model_name = explore_fields["model"]
+        explore_name = explore_fields["explore"]
+        for field in explore_fields["fields"]:
+            times_used = usage.get((model_name, explore_name, field), 0)
+            if times_used < 50:
+                unused_fields.append(
+                    {
+                        "model": model_name,
+                        "explore": explore_name,
+                        "field": field,
+                        "times_used": times_used,
+                    }
+                )
 
-    # Get the run count for each field
-    output = []
-    for explore in explore_fields:
-        for field in explore["fields"]:
-            times_used = 0
-            for result in results:
-                if (
-                    result["field_usage.model"] == explore["model"]
-                    and result["field_usage.explore"] == explore["explore"]
-                    and result["field_usage.field"] == field
-                ):
-                    times_used += result["field_usage.times_used"]
-            output.append(
-                {
-                    "model": explore["model"],
-                    "explore": explore["explore"],
-                    "field": field,
-                    "times_used": times_used,
-                }
-            )
+    return unused_fields
 
-    # Filter out fields with less than 50 runs in the last 90 days
-    unused_fields = [field for field in output if field["times_used"] < 50]
 
-    return unused_fields
+_explore_fields_cache: dict[
+    tuple[str, str, str], tuple[float, "asyncio.Task[dict[str, Any]]"]
+] = {}
 
 
 async def get_explore_fields(
     client: LookerSdkClient, model: str, explore: str
 ) -> dict[str, Any]:
-    print(f"Getting fields for {model}.{explore}")
-    explore_fields = client.lookml_model_explore(
-        lookml_model_name=model, explore_name=explore, fields="fields"
-    )
+    """Get the fields for an explore, deduplicating concurrent and repeat fetches."""
+    host_url = cast(AppApiSettings, client.auth.settings).host_url
+    key = (host_url, model, explore)
+    hit = _explore_fields_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < CACHE_TTL_SECONDS:
+        task = hit[1]
+    else:
+        # Run the fetch as its own task so no caller owns it and a caller's
+        # cancellation can't propagate into it
+        task = asyncio.get_running_loop().create_task(
+            fetch_explore_fields(client, model, explore)
+        )
+        _explore_fields_cache[key] = (time.monotonic(), task)
+    try:
+        # Shield so a cancelled caller only gives up its own wait; the
+        # shared fetch keeps running for everyone else
+        return await asyncio.shield(task)
+    except BaseException:
+        # Evict failed fetches so the next caller retries, but never a
+        # still-running or successful task another waiter may need
+        if task.done() and (task.cancelled() or task.exception() is not None):
+            entry = _explore_fields_cache.get(key)
+            if entry is not None and entry[1] is task:
+                _explore_fields_cache.pop(key, None)
+        raise
+
+
+async def fetch_explore_fields(
+    client: LookerSdkClient, model: str, explore: str
+) -> dict[str, Any]:
+    logger.debug("Getting fields for %s.%s", model, explore)
+    async with EXPLORE_SEMAPHORE:
+        explore_fields = await sdk_call(
+            client.lookml_model_explore,
+            lookml_model_name=model,
+            explore_name=explore,
+            fields="fields",
+        )
 
-    fields = []
+    # Intern the names so the (model, explore, field) joins hash and compare
+    # already-seen string objects instead of fresh SDK-returned copies
+    fields: list[str] = []
     if explore_fields.fields:
         if explore_fields.fields.dimensions:
             fields.extend(
-                [dimension.name for dimension in explore_fields.fields.dimensions]
+                sys.intern(dimension.name)
+                for dimension in explore_fields.fields.dimensions
+                if dimension.name
             )
         if explore_fields.fields.measures:
-            fields.extend([measure.name for measure in explore_fields.fields.measures])
+            fields.extend(
+                sys.intern(measure.name)
+                for measure in explore_fields.fields.measures
+                if measure.name
+            )
 
     return {
-        "model": model,
-        "explore": explore,
-        "fields": fields,
+        "model": sys.intern(model),
+        "explore": sys.intern(explore),
+        "fields": tuple(fields),
     }
 
 